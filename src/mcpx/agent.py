@@ -1,8 +1,18 @@
-import json
+import types
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Any, Callable
 
-from litellm import completion
+from mcpx.tool_cache import cache_key, get_tool_cache
+
+try:
+    from orjson import JSONDecodeError as _JSONDecodeError
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - orjson is optional
+    from json import JSONDecodeError as _JSONDecodeError
+    from json import loads as _json_loads
+
+_MAX_PARALLEL_TOOLS = 8
 
 
 @dataclass
@@ -11,6 +21,7 @@ class ToolDef:
     description: str
     parameters: dict
     execute: Callable[[dict[str, Any]], str] | None = None
+    cacheable: bool = True
 
 
 def _to_openai_tools(tools: list[ToolDef]) -> list[dict]:
@@ -37,8 +48,28 @@ def agent_loop(
     on_step: Callable[[int, str, dict], None] | None = None,
     on_text: Callable[[str], None] | None = None,
 ) -> dict | None:
-    executors = {t.name: t.execute for t in tools}
+    # Deferred: litellm's transitive imports (openai, tokenizers, ...) cost
+    # hundreds of ms and are only needed once a loop actually runs.
+    from litellm import completion
+
+    executors = types.MappingProxyType({t.name: t.execute for t in tools})
+    cacheable = {t.name for t in tools if t.cacheable}
     openai_tools = _to_openai_tools(tools)
+
+    def _invoke(name: str, args: dict) -> str:
+        key = cache_key(name, args) if name in cacheable else None
+        if key:
+            cached = get_tool_cache().get(key)
+            if cached is not None:
+                return cached
+        try:
+            result = executors[name](args)
+        except Exception as e:
+            return f"Error executing {name}: {e}"
+        if key:
+            get_tool_cache().put(key, result)
+        return result
+
     messages: list[dict] = [
         {"role": "system", "content": system_prompt},
         {"role": "user", "content": user_message},
@@ -51,15 +82,18 @@ def agent_loop(
             if msg.content and on_text:
                 on_text(msg.content)
             return None
-        messages.append(msg)
+        # Append a plain dict so LiteLLM doesn't re-serialize the Pydantic
+        # message object on every subsequent turn.
+        messages.append(msg.model_dump(exclude_none=True))
+        pending: list[tuple[Any, str, dict]] = []
         for tc in msg.tool_calls:
             step += 1
             if step > max_steps:
                 break
             name = tc.function.name
             try:
-                args = json.loads(tc.function.arguments)
-            except json.JSONDecodeError as e:
+                args = _json_loads(tc.function.arguments)
+            except _JSONDecodeError as e:
                 if on_step:
                     on_step(step, name, {})
                 messages.append({"role": "tool", "tool_call_id": tc.id, "content": f"Invalid JSON arguments: {e}"})
@@ -68,14 +102,21 @@ def agent_loop(
                 on_step(step, name, args)
             if name == terminal_tool:
                 return args
-            executor = executors.get(name)
-            if executor is None:
+            if executors.get(name) is None:
                 messages.append({"role": "tool", "tool_call_id": tc.id, "content": f"Unknown tool: {name}"})
                 continue
-            try:
-                result = executor(args)
-            except Exception as e:
-                result = f"Error executing {name}: {e}"
+            pending.append((tc, name, args))
+        # Independent tool calls from one turn run concurrently; most are
+        # network-bound, so wall time drops from their sum to their max.
+        if len(pending) == 1:
+            _, name, args = pending[0]
+            results = [_invoke(name, args)]
+        elif pending:
+            with ThreadPoolExecutor(max_workers=min(_MAX_PARALLEL_TOOLS, len(pending))) as pool:
+                results = list(pool.map(lambda p: _invoke(p[1], p[2]), pending))
+        else:
+            results = []
+        for (tc, _, _), result in zip(pending, results):
             messages.append({"role": "tool", "tool_call_id": tc.id, "content": result})
     if on_text:
         on_text("Agent reached maximum steps without a result.")
@@ -1,7 +1,10 @@
 import asyncio
+import atexit
 import os
+import re
 import signal
 import sys
+import time
 from contextlib import AsyncExitStack
 from typing import Any, TextIO
 
@@ -32,6 +35,10 @@ _NOISE_MARKERS = (
     "cancel_scope.__exit__",
 )
 
+# One compiled alternation scans each line in a single C-level pass instead
+# of one substring probe per marker.
+_NOISE_RE = re.compile("|".join(re.escape(m) for m in _NOISE_MARKERS))
+
 
 class ServerError(Exception):
     """Clean error for MCP server failures."""
@@ -45,17 +52,22 @@ class _FilteredStderr:
         self._suppressing = False
 
     def write(self, s: str) -> int:
+        kept: list[str] = []
         for line in s.splitlines(keepends=True):
             stripped = line.strip()
             if not stripped:
                 continue
-            if any(m in stripped for m in _NOISE_MARKERS):
+            if _NOISE_RE.search(stripped) is not None:
                 self._suppressing = True
                 continue
-            if self._suppressing and (stripped.startswith("|") or stripped.startswith("+")):
+            if self._suppressing and stripped.startswith(("|", "+")):
                 continue
             self._suppressing = False
-            self._real.write(line)
+            kept.append(line)
+        # One write per call instead of one per surviving line: stderr is
+        # unbuffered, so each write is a syscall.
+        if kept:
+            self._real.write("".join(kept))
         return len(s)
 
     def flush(self) -> None:
@@ -75,15 +87,35 @@ class MCPClient:
     def __init__(self, server: ServerConfig, config_manager: ConfigManager) -> None:
         self._server = server
         self._env = config_manager.resolve_env(server)
+        # Deferred to connect(): acquire() constructs a throwaway client per
+        # call just for its pool_key, so a pool hit never copies os.environ.
+        self._full_env: dict[str, str] | None = None
         self._stack = AsyncExitStack()
         self._session: ClientSession | None = None
+        self._connected_at = 0.0
 
-    async def __aenter__(self) -> "MCPClient":
-        env = {**os.environ, **self._env}
+    @property
+    def pool_key(self) -> tuple[Any, ...]:
+        """Identity of the spawned server: same key means the session is reusable."""
+        return (self._server.command, tuple(self._server.args), tuple(sorted(self._env.items())))
+
+    @property
+    def connected_at(self) -> float:
+        return self._connected_at
+
+    async def connect(self) -> "MCPClient":
+        if self._full_env is None:
+            # An allowlist keeps the subprocess env block small and avoids
+            # leaking unrelated variables into the server.
+            if self._server.env_allowlist is not None:
+                inherited = {k: os.environ[k] for k in self._server.env_allowlist if k in os.environ}
+            else:
+                inherited = dict(os.environ)
+            self._full_env = {**inherited, **self._env}
         params = StdioServerParameters(
             command=self._server.command,
             args=self._server.args,
-            env=env,
+            env=self._full_env,
         )
         try:
             read_stream, write_stream = await self._stack.enter_async_context(
@@ -106,13 +138,21 @@ class MCPClient:
             )
         except Exception as e:
             raise ServerError(f"Server connection failed: {e}") from e
+        self._connected_at = time.monotonic()
         return self
 
-    async def __aexit__(self, *exc: object) -> None:
+    async def disconnect(self) -> None:
         try:
             await self._stack.aclose()
         except Exception:
             pass
+        self._session = None
+
+    async def __aenter__(self) -> "MCPClient":
+        return await self.connect()
+
+    async def __aexit__(self, *exc: object) -> None:
+        await self.disconnect()
 
     async def list_tools(self) -> list[Tool]:
         assert self._session
@@ -124,24 +164,108 @@ class MCPClient:
         return await self._session.call_tool(name=name, arguments=arguments)
 
 
+class SessionPool:
+    """Caches live MCPClient sessions for reuse within one process.
+
+    Reusing a pooled session skips the subprocess spawn and MCP initialize
+    handshake that otherwise dominate per-call latency. Idle sessions are
+    health-checked before reuse and dropped after `ttl` seconds.
+
+    Scope note: this is deliberately in-process only, so it helps commands
+    that make several calls (refresh, probe) but not a shell loop of
+    separate `mcpx` invocations. A cross-invocation daemon would keep
+    credentialed server subprocesses alive under a user-reachable socket
+    and need lifecycle management (startup, idle shutdown, staleness on
+    config edits) that doesn't fit a stateless CLI proxy; if that trade-off
+    is ever taken, a daemon can wrap this same pool.
+    """
+
+    def __init__(self, ttl: float = 300.0, ping_timeout: float = 5.0) -> None:
+        self._idle: dict[tuple[Any, ...], MCPClient] = {}
+        self._ttl = ttl
+        self._ping_timeout = ping_timeout
+
+    async def acquire(self, server: ServerConfig, config_manager: ConfigManager) -> MCPClient:
+        fresh = MCPClient(server, config_manager)
+        pooled = self._idle.pop(fresh.pool_key, None)
+        if pooled is not None:
+            if time.monotonic() - pooled.connected_at < self._ttl and await self._healthy(pooled):
+                return pooled
+            await pooled.disconnect()
+        return await fresh.connect()
+
+    async def release(self, client: MCPClient) -> None:
+        if client.pool_key in self._idle:
+            await client.disconnect()
+        else:
+            self._idle[client.pool_key] = client
+
+    async def _healthy(self, client: MCPClient) -> bool:
+        try:
+            await asyncio.wait_for(client.list_tools(), timeout=self._ping_timeout)
+        except Exception:
+            return False
+        return True
+
+    async def aclose(self) -> None:
+        idle, self._idle = self._idle, {}
+        for client in idle.values():
+            await client.disconnect()
+
+
+_loop: asyncio.AbstractEventLoop | None = None
+_pool: SessionPool | None = None
+_current_task: asyncio.Task | None = None
+
+
+def _cancel_current_task() -> None:
+    if _current_task is not None and not _current_task.done():
+        _current_task.cancel()
+
+
+def _shutdown() -> None:
+    if _loop is None or _loop.is_closed():
+        return
+    try:
+        if _pool is not None:
+            _loop.run_until_complete(_pool.aclose())
+    finally:
+        _loop.close()
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared event loop, creating it (and the session pool) on first use.
+
+    A persistent loop keeps pooled stdio sessions alive between calls;
+    asyncio.run would tear them down with the loop.
+    """
+    global _loop, _pool
+    if _loop is None or _loop.is_closed():
+        _loop = asyncio.new_event_loop()
+        _pool = SessionPool()
+        # Handlers are registered once per loop; they cancel whichever task
+        # is current, so per-call add/remove pairs are unnecessary.
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            _loop.add_signal_handler(sig, _cancel_current_task)
+        atexit.register(_shutdown)
+    return _loop
+
+
 async def _run_with_client(
     server: ServerConfig,
     config_manager: ConfigManager,
     callback: Any,
 ) -> Any:
-    loop = asyncio.get_running_loop()
-    task = asyncio.current_task()
-
-    def _signal_handler() -> None:
-        if task and not task.done():
-            task.cancel()
-
-    for sig in (signal.SIGINT, signal.SIGTERM):
-        loop.add_signal_handler(sig, _signal_handler)
+    global _current_task
+    _current_task = asyncio.current_task()
 
+    assert _pool is not None
     try:
-        async with MCPClient(server, config_manager) as client:
+        client = await _pool.acquire(server, config_manager)
+        try:
             return await callback(client)
+        finally:
+            await _pool.release(client)
     except asyncio.CancelledError:
         print("Interrupted.", file=sys.stderr)
         sys.exit(130)
@@ -150,8 +274,7 @@ async def _run_with_client(
     except Exception as e:
         raise ServerError(f"Unexpected error: {e}") from e
     finally:
-        for sig in (signal.SIGINT, signal.SIGTERM):
-            loop.remove_signal_handler(sig)
+        _current_task = None
 
 
 def run_with_client(
@@ -160,9 +283,63 @@ def run_with_client(
     callback: Any,
 ) -> Any:
     """Run callback(client) with filtered stderr to suppress anyio cleanup noise."""
+    loop = _get_loop()
     real_stderr = sys.stderr
     sys.stderr = _FilteredStderr(real_stderr)
     try:
-        return asyncio.run(_run_with_client(server, config_manager, callback))
+        return loop.run_until_complete(_run_with_client(server, config_manager, callback))
+    finally:
+        sys.stderr = real_stderr
+
+
+async def _run_with_clients(
+    servers: dict[str, ServerConfig],
+    config_manager: ConfigManager,
+    callback: Any,
+    max_concurrency: int,
+) -> dict[str, Any]:
+    global _current_task
+    _current_task = asyncio.current_task()
+    sem = asyncio.Semaphore(max_concurrency)
+
+    assert _pool is not None
+
+    async def _one(server: ServerConfig) -> Any:
+        async with sem:
+            client = await _pool.acquire(server, config_manager)
+            try:
+                return await callback(client)
+            finally:
+                await _pool.release(client)
+
+    try:
+        results = await asyncio.gather(*(_one(s) for s in servers.values()), return_exceptions=True)
+    except asyncio.CancelledError:
+        print("Interrupted.", file=sys.stderr)
+        sys.exit(130)
+    finally:
+        _current_task = None
+    return dict(zip(servers.keys(), results))
+
+
+def run_with_clients(
+    servers: dict[str, ServerConfig],
+    config_manager: ConfigManager,
+    callback: Any,
+    max_concurrency: int = 8,
+) -> dict[str, Any]:
+    """Run callback(client) against several servers concurrently.
+
+    Handshakes overlap, so a batch takes roughly the slowest server rather
+    than the sum. Returns alias -> result, with exceptions returned rather
+    than raised so one bad server doesn't lose the rest.
+    """
+    loop = _get_loop()
+    real_stderr = sys.stderr
+    sys.stderr = _FilteredStderr(real_stderr)
+    try:
+        return loop.run_until_complete(
+            _run_with_clients(servers, config_manager, callback, max_concurrency)
+        )
     finally:
         sys.stderr = real_stderr
@@ -1,38 +1,80 @@
 import json
+import os
 import time
 from pathlib import Path
 from typing import Any
 
 from mcpx.config import CONFIG_DIR
 
+try:
+    import orjson
+
+    def _loads(data: bytes | str) -> Any:
+        return orjson.loads(data)
+
+    def _dumps(data: Any) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+except ImportError:  # pragma: no cover - orjson is optional
+
+    def _loads(data: bytes | str) -> Any:
+        return json.loads(data)
+
+    def _dumps(data: Any) -> bytes:
+        return json.dumps(data, indent=2).encode()
+
+
 CACHE_DIR = CONFIG_DIR / "cache"
 TTL_SECONDS = 24 * 60 * 60  # 24 hours
 
+# Cache files are named "{alias}.{expires_at_ns}.json" so a single scandir
+# decides freshness; expired or stale entries are skipped without being
+# opened or parsed.
 
-def _cache_path(alias: str) -> Path:
-    return CACHE_DIR / f"{alias}.json"
+
+def _entries(alias: str) -> list[tuple[int, Path]]:
+    prefix = f"{alias}."
+    found: list[tuple[int, Path]] = []
+    try:
+        names = os.listdir(CACHE_DIR)
+    except FileNotFoundError:
+        return found
+    for name in names:
+        if not (name.startswith(prefix) and name.endswith(".json")):
+            continue
+        expires_part = name[len(prefix) : -len(".json")]
+        if not expires_part.isdigit():
+            continue
+        found.append((int(expires_part), CACHE_DIR / name))
+    return found
 
 
 def load_cached_tools(alias: str) -> list[dict[str, Any]] | None:
-    path = _cache_path(alias)
-    if not path.exists():
-        return None
-    try:
-        data = json.loads(path.read_text())
-    except (json.JSONDecodeError, ValueError):
-        path.unlink(missing_ok=True)
-        return None
-    if time.time() - data.get("timestamp", 0) > TTL_SECONDS:
-        path.unlink(missing_ok=True)
-        return None
-    return data.get("tools")
+    now = time.time_ns()
+    for expires_ns, path in _entries(alias):
+        if expires_ns <= now:
+            path.unlink(missing_ok=True)
+            continue
+        try:
+            return _loads(path.read_bytes())
+        except (json.JSONDecodeError, ValueError):
+            path.unlink(missing_ok=True)
+            return None
+    return None
 
 
 def save_tools_cache(alias: str, tools: list[dict[str, Any]]) -> None:
     CACHE_DIR.mkdir(parents=True, exist_ok=True)
-    data = {"timestamp": time.time(), "tools": tools}
-    _cache_path(alias).write_text(json.dumps(data, indent=2))
+    invalidate_cache(alias)
+    expires_ns = time.time_ns() + TTL_SECONDS * 1_000_000_000
+    path = CACHE_DIR / f"{alias}.{expires_ns}.json"
+    tmp = CACHE_DIR / f".{alias}.tmp"
+    tmp.write_bytes(_dumps(tools))
+    os.replace(tmp, path)
 
 
 def invalidate_cache(alias: str) -> None:
-    _cache_path(alias).unlink(missing_ok=True)
+    for _, path in _entries(alias):
+        path.unlink(missing_ok=True)
+    # Pre-expiry-name format used a bare "{alias}.json".
+    (CACHE_DIR / f"{alias}.json").unlink(missing_ok=True)
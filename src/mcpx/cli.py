@@ -1,19 +1,27 @@
-import json
+from __future__ import annotations
+
+import dataclasses
 import shlex
 import sys
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import click
 from rich.console import Console
 from rich.table import Table
 
 from mcpx import __version__
-from mcpx.bridge import MCPClient, ServerError, run_with_client
 from mcpx.cache import invalidate_cache, load_cached_tools, save_tools_cache
-from mcpx.config import ConfigManager, LLMConfig, ServerConfig
-from mcpx.installer import InstallSpec, run_agent
+from mcpx.config import ConfigManager, LLMConfig, ServerConfig, get_config_manager
+from mcpx.install_cache import load_cached_spec, save_spec_cache
 from mcpx.schema import build_click_params, validate_args
 
+# mcpx.bridge (mcp, anyio) and mcpx.installer (litellm, httpx, bs4) are
+# imported inside the commands that need them so `mcpx list` and friends
+# don't pay their import cost.
+if TYPE_CHECKING:
+    from mcpx.bridge import MCPClient
+    from mcpx.installer import InstallSpec
+
 err_console = Console(stderr=True)
 
 
@@ -42,7 +50,7 @@ def add(alias: str, cmd: str, args_: tuple[str, ...], envs: tuple[str, ...], env
         env_file=env_file,
         timeout=timeout,
     )
-    cm = ConfigManager()
+    cm = get_config_manager()
     cm.add_server(alias, server)
     err_console.print(f"Server [bold]{alias}[/bold] added.")
 
@@ -50,7 +58,7 @@ def add(alias: str, cmd: str, args_: tuple[str, ...], envs: tuple[str, ...], env
 @click.command(name="list")
 def list_servers() -> None:
     """List configured MCP servers."""
-    cm = ConfigManager()
+    cm = get_config_manager()
     servers = cm.list_servers()
     if not servers:
         err_console.print("No servers configured.")
@@ -71,7 +79,7 @@ def list_servers() -> None:
 @click.argument("alias")
 def remove(alias: str) -> None:
     """Remove an MCP server configuration."""
-    cm = ConfigManager()
+    cm = get_config_manager()
     if cm.remove_server(alias):
         invalidate_cache(alias)
         err_console.print(f"Server [bold]{alias}[/bold] removed.")
@@ -83,7 +91,7 @@ def remove(alias: str) -> None:
 @click.option("--model", required=True, help="LLM model name (e.g. claude-sonnet-4-20250514).")
 def config_llm(model: str) -> None:
     """Configure the LLM model for install command."""
-    cm = ConfigManager()
+    cm = get_config_manager()
     cm.set_llm(LLMConfig(model=model))
     err_console.print(f"LLM model set to [bold]{model}[/bold].")
 
@@ -99,25 +107,45 @@ def _format_add_command(spec: InstallSpec) -> str:
 @click.argument("url")
 @click.option("--alias", default=None, help="Override the server alias.")
 @click.option("--yes", "-y", is_flag=True, default=False, help="Skip confirmation prompt.")
-def install(url: str, alias: str | None, yes: bool) -> None:
+@click.option("--no-cache", is_flag=True, default=False, help="Ignore cached analysis and re-run the agent.")
+def install(url: str, alias: str | None, yes: bool, no_cache: bool) -> None:
     """Install an MCP server from a URL (GitHub, PyPI, npm, etc.)."""
-    cm = ConfigManager()
+    cm = get_config_manager()
     model = cm.config.llm.model
-    err_console.print(f"Analyzing [bold]{url}[/bold] with [bold]{model}[/bold]...")
-    try:
-        spec = run_agent(
-            model,
-            url,
-            on_step=lambda step, name, args: err_console.print(
-                f"  Step {step}: {name}({', '.join(f'{k}={v!r}' for k, v in args.items())})"
-            ),
-            on_text=lambda text: err_console.print(text),
-        )
-    except Exception as e:
-        raise click.ClickException(f"Agent error: {e}")
+
+    from mcpx.installer import InstallSpec, run_agent
+
+    spec: InstallSpec | None = None
+    if not no_cache:
+        cached = load_cached_spec(model, url)
+        if cached is not None:
+            # Entries written by another mcpx version may not match the
+            # current fields; treat any mismatch as a cache miss.
+            known = {f.name for f in dataclasses.fields(InstallSpec)}
+            try:
+                spec = InstallSpec(**{k: v for k, v in cached.items() if k in known})
+            except TypeError:
+                spec = None
+            else:
+                err_console.print(f"Using cached analysis for [bold]{url}[/bold] (--no-cache to re-run).")
 
     if spec is None:
-        raise SystemExit(1)
+        err_console.print(f"Analyzing [bold]{url}[/bold] with [bold]{model}[/bold]...")
+        try:
+            spec = run_agent(
+                model,
+                url,
+                on_step=lambda step, name, args: err_console.print(
+                    f"  Step {step}: {name}({', '.join(f'{k}={v!r}' for k, v in args.items())})"
+                ),
+                on_text=lambda text: err_console.print(text),
+            )
+        except Exception as e:
+            raise click.ClickException(f"Agent error: {e}")
+
+        if spec is None:
+            raise SystemExit(1)
+        save_spec_cache(model, url, dataclasses.asdict(spec))
 
     if alias:
         spec.alias = alias
@@ -144,6 +172,36 @@ def install(url: str, alias: str | None, yes: bool) -> None:
     err_console.print(f"\nServer [bold]{spec.alias}[/bold] added.")
 
 
+@click.command()
+@click.argument("aliases", nargs=-1)
+def refresh(aliases: tuple[str, ...]) -> None:
+    """Refresh the tool schema cache for all (or the given) servers."""
+    from mcpx.bridge import run_with_clients
+
+    cm = get_config_manager()
+    servers = cm.list_servers()
+    if aliases:
+        missing = [a for a in aliases if a not in servers]
+        if missing:
+            raise click.ClickException(f"Unknown server(s): {', '.join(missing)}")
+        servers = {a: servers[a] for a in aliases}
+    if not servers:
+        err_console.print("No servers configured.")
+        return
+
+    results = run_with_clients(servers, cm, _dump_tools)
+    failed = False
+    for alias, result in results.items():
+        if isinstance(result, BaseException):
+            failed = True
+            err_console.print(f"[red]{alias}[/red]: {result}")
+        else:
+            save_tools_cache(alias, result)
+            err_console.print(f"[bold]{alias}[/bold]: {len(result)} tools cached.")
+    if failed:
+        raise SystemExit(1)
+
+
 # --- Dynamic server/tool dispatch ---
 
 
@@ -151,18 +209,25 @@ def _mask_env(env: dict[str, str]) -> dict[str, str]:
     return {k: "***" for k in env}
 
 
+async def _dump_tools(client: MCPClient) -> list[dict[str, Any]]:
+    from mcpx.cache import _loads
+
+    tools = await client.list_tools()
+    # model_dump_json hits Pydantic's Rust encoder directly; round-tripping
+    # through _loads is cheaper than the mode="json" Python-dict path.
+    return [_loads(t.model_dump_json()) for t in tools]
+
+
 def _fetch_tools_cached(alias: str, server: ServerConfig, cm: ConfigManager, refresh: bool) -> list[dict[str, Any]]:
+    from mcpx.bridge import ServerError, run_with_client
+
     if not refresh:
         cached = load_cached_tools(alias)
         if cached is not None:
             return cached
 
-    async def _fetch(client: MCPClient) -> list[dict[str, Any]]:
-        tools = await client.list_tools()
-        return [t.model_dump(mode="json") for t in tools]
-
     try:
-        tools_data = run_with_client(server, cm, _fetch)
+        tools_data = run_with_client(server, cm, _dump_tools)
     except ServerError as e:
         raise click.ClickException(str(e))
     save_tools_cache(alias, tools_data)
@@ -199,13 +264,15 @@ class ToolCommand(click.Command):
         )
 
     def _execute(self, as_json: bool, debug: bool, dry_run: bool, **kwargs: Any) -> None:
+        from mcpx.bridge import ServerError, run_with_client
+
         schema = self.tool_data.get("inputSchema", {})
         args = {k: v for k, v in kwargs.items() if v is not None}
         validate_args(schema, args)
 
         if dry_run:
             payload = {"tool": self.tool_data["name"], "arguments": args}
-            err_console.print_json(json.dumps(payload))
+            err_console.print_json(data=payload)
             return
 
         server = self.cm.get_server(self.alias)
@@ -222,13 +289,13 @@ class ToolCommand(click.Command):
             if debug:
                 err_console.print(f"[dim]Response: isError={result.isError}, content_count={len(result.content)}[/dim]")
             if as_json:
-                print(json.dumps(result.model_dump(mode="json"), indent=2))
+                print(result.model_dump_json(indent=2))
             else:
                 for block in result.content:
                     if hasattr(block, "text"):
                         print(block.text)
                     else:
-                        print(json.dumps(block.model_dump(mode="json"), indent=2))
+                        print(block.model_dump_json(indent=2))
             if result.isError:
                 sys.exit(1)
 
@@ -249,6 +316,7 @@ class ServerGroup(click.MultiCommand):
         self.server = server
         self.cm = cm
         self._tools: list[dict[str, Any]] | None = None
+        self._cmd_cache: dict[str, ToolCommand] = {}
 
     @staticmethod
     def _is_refresh(ctx: click.Context) -> bool:
@@ -265,10 +333,13 @@ class ServerGroup(click.MultiCommand):
         return [t["name"] for t in tools]
 
     def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        cached = self._cmd_cache.get(cmd_name)
+        if cached is not None:
+            return cached
         tools = self._load_tools(refresh=self._is_refresh(ctx))
         for t in tools:
             if t["name"] == cmd_name:
-                return ToolCommand(self.alias, t, self.cm)
+                return self._cmd_cache.setdefault(cmd_name, ToolCommand(self.alias, t, self.cm))
         return None
 
     def format_help(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
@@ -279,11 +350,18 @@ class ServerGroup(click.MultiCommand):
 class McpxCLI(click.MultiCommand):
     """Root CLI that dispatches to static commands or dynamic server groups."""
 
-    STATIC_COMMANDS = {"add": add, "list": list_servers, "remove": remove, "install": install, "config-llm": config_llm}
+    STATIC_COMMANDS = {
+        "add": add,
+        "list": list_servers,
+        "remove": remove,
+        "install": install,
+        "config-llm": config_llm,
+        "refresh": refresh,
+    }
 
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
-        self.cm = ConfigManager()
+        self.cm = get_config_manager()
 
     def list_commands(self, ctx: click.Context) -> list[str]:
         cmds = list(self.STATIC_COMMANDS.keys())
@@ -303,9 +381,43 @@ class McpxCLI(click.MultiCommand):
 @click.version_option(__version__, prog_name="mcpx")
 @click.option("--refresh", is_flag=True, default=False, help="Refresh tool schema cache.")
 @click.pass_context
-def main(ctx: click.Context, refresh: bool) -> None:
+def cli(ctx: click.Context, refresh: bool) -> None:
     """mcpx — A stateless CLI proxy for MCP servers."""
     ctx.ensure_object(dict)
     ctx.obj["refresh"] = refresh
     if ctx.invoked_subcommand is None:
         click.echo(ctx.get_help(), err=True)
+
+
+def _try_fast_path(argv: list[str]) -> ToolCommand | None:
+    """Resolve `mcpx <alias> <tool> [...]` straight from the schema cache.
+
+    The common invocation shape doesn't need MultiCommand introspection:
+    look the alias up in the config, the tool up in the cached catalog, and
+    build just that one ToolCommand. Anything else — static commands,
+    options like --refresh, a cold cache — falls back to the full group.
+    """
+    if len(argv) < 2:
+        return None
+    alias, tool_name = argv[0], argv[1]
+    if alias in McpxCLI.STATIC_COMMANDS or alias.startswith("-") or tool_name.startswith("-"):
+        return None
+    cm = get_config_manager()
+    if cm.get_server(alias) is None:
+        return None
+    tools = load_cached_tools(alias)
+    if tools is None:
+        return None
+    for t in tools:
+        if t["name"] == tool_name:
+            return ToolCommand(alias, t, cm)
+    return None
+
+
+def main() -> None:
+    argv = sys.argv[1:]
+    cmd = _try_fast_path(argv)
+    if cmd is not None:
+        cmd.main(argv[2:], prog_name=f"mcpx {argv[0]} {argv[1]}")
+        return
+    cli()
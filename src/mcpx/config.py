@@ -1,4 +1,8 @@
+import functools
+import json
+import os
 from pathlib import Path
+from typing import Any
 
 from dotenv import dotenv_values
 from pydantic import BaseModel, Field
@@ -7,11 +11,20 @@ CONFIG_DIR = Path.home() / ".config" / "mcpx"
 CONFIG_FILE = CONFIG_DIR / "config.json"
 
 
+def _stat_or_none(path: Path | str) -> os.stat_result | None:
+    """One syscall answering both 'does it exist' and 'when did it change'."""
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
 class ServerConfig(BaseModel):
     command: str
     args: list[str] = Field(default_factory=list)
     env: dict[str, str] = Field(default_factory=dict)
     env_file: str | None = None
+    env_allowlist: list[str] | None = None
     timeout: int = 30
 
 
@@ -26,6 +39,67 @@ class AppConfig(BaseModel):
     llm: LLMConfig = Field(default_factory=LLMConfig)
 
 
+def _construct_config(data: dict[str, Any]) -> AppConfig:
+    """Rebuild AppConfig from already-validated data, skipping field validation.
+
+    The config file is written by mcpx itself via _save, so its contents
+    passed validation once; model_construct turns the load back into plain
+    attribute assignment.
+    """
+    servers = {alias: ServerConfig.model_construct(**raw) for alias, raw in data.get("servers", {}).items()}
+    llm = LLMConfig.model_construct(**data.get("llm", {}))
+    rest = {k: v for k, v in data.items() if k not in ("servers", "llm")}
+    return AppConfig.model_construct(servers=servers, llm=llm, **rest)
+
+
+def _is_int(value: Any) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _well_formed_server(raw: dict[str, Any]) -> bool:
+    """True when a server entry matches every shape the fast path relies on."""
+    args = raw.get("args", [])
+    env = raw.get("env", {})
+    allowlist = raw.get("env_allowlist")
+    return (
+        isinstance(raw.get("command"), str)
+        and isinstance(args, list)
+        and all(isinstance(a, str) for a in args)
+        and isinstance(env, dict)
+        and all(isinstance(k, str) and isinstance(v, str) for k, v in env.items())
+        and isinstance(raw.get("env_file"), str | None)
+        and (allowlist is None or (isinstance(allowlist, list) and all(isinstance(v, str) for v in allowlist)))
+        and _is_int(raw.get("timeout", 30))
+    )
+
+
+def _well_formed(data: dict[str, Any]) -> bool:
+    servers = data.get("servers", {})
+    llm = data.get("llm", {})
+    return (
+        isinstance(servers, dict)
+        and all(isinstance(s, dict) and _well_formed_server(s) for s in servers.values())
+        and isinstance(llm, dict)
+        and isinstance(llm.get("model", ""), str)
+        and _is_int(data.get("global_timeout", 30))
+        and isinstance(data.get("cache_schemas", True), bool)
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _parse_config(path_str: str, mtime_ns: int) -> AppConfig:
+    """Parse the config file once per (path, mtime); repeat loads are cache hits."""
+    text = Path(path_str).read_text()
+    try:
+        data = json.loads(text)
+        if isinstance(data, dict) and _well_formed(data):
+            return _construct_config(data)
+    except (ValueError, TypeError, AttributeError):
+        pass
+    # Hand-edited or unexpected shape: fall back to full validation.
+    return AppConfig.model_validate_json(text)
+
+
 class ConfigManager:
     def __init__(self) -> None:
         self._config = self._load()
@@ -35,13 +109,15 @@ class ConfigManager:
         return self._config
 
     def _load(self) -> AppConfig:
-        if CONFIG_FILE.exists():
-            return AppConfig.model_validate_json(CONFIG_FILE.read_text())
-        return AppConfig()
+        st = _stat_or_none(CONFIG_FILE)
+        if st is None:
+            return AppConfig()
+        return _parse_config(str(CONFIG_FILE), st.st_mtime_ns)
 
     def _save(self) -> None:
         CONFIG_DIR.mkdir(parents=True, exist_ok=True)
         CONFIG_FILE.write_text(self._config.model_dump_json(indent=2))
+        _parse_config.cache_clear()
 
     def add_server(self, alias: str, server: ServerConfig) -> None:
         self._config.servers[alias] = server
@@ -68,9 +144,26 @@ class ConfigManager:
         """Merge env vars: inline env > local .env > configured env_file."""
         env: dict[str, str] = {}
         if server.env_file:
-            env.update(dotenv_values(server.env_file))
-        local_env = Path(".env")
-        if local_env.exists():
-            env.update(dotenv_values(local_env))
+            env.update(_dotenv_values(server.env_file))
+        env.update(_dotenv_values(".env"))
         env.update(server.env)
         return env
+
+
+@functools.lru_cache(maxsize=32)
+def _dotenv_cached(path_str: str, mtime_ns: int) -> tuple[tuple[str, str], ...]:
+    return tuple((k, v) for k, v in dotenv_values(path_str).items() if v is not None)
+
+
+def _dotenv_values(path: str) -> dict[str, str]:
+    """dotenv_values memoized on (path, mtime); one stat covers existence too."""
+    st = _stat_or_none(path)
+    if st is None:
+        return {}
+    return dict(_dotenv_cached(path, st.st_mtime_ns))
+
+
+@functools.lru_cache(maxsize=1)
+def get_config_manager() -> ConfigManager:
+    """Shared ConfigManager so CLI dispatch paths reuse one parsed config."""
+    return ConfigManager()
@@ -0,0 +1,76 @@
+"""Disk cache for `mcpx install` analyses keyed by (model, URL).
+
+The install agent is deterministic enough given a model and a URL that
+re-running it during troubleshooting just repeats seconds of LLM calls;
+a cached spec turns that into a disk read. Layout mirrors cache.py:
+the expiry is encoded in the filename, writes are atomic.
+"""
+
+import hashlib
+import json
+import os
+import time
+from typing import Any
+from urllib.parse import urlparse
+
+from mcpx.cache import _dumps, _loads
+from mcpx.config import CONFIG_DIR
+
+CACHE_DIR = CONFIG_DIR / "install_cache"
+TTL_SECONDS = 7 * 24 * 60 * 60  # 1 week
+
+
+def canonicalize_url(url: str) -> str:
+    if "://" not in url:
+        url = "https://" + url
+    parsed = urlparse(url.strip())
+    canonical = f"{parsed.scheme.lower()}://{parsed.netloc.lower()}{parsed.path.rstrip('/')}"
+    if parsed.query:
+        canonical += f"?{parsed.query}"
+    return canonical
+
+
+def _digest(model: str, url: str) -> str:
+    return hashlib.blake2b(f"{model}\0{canonicalize_url(url)}".encode()).hexdigest()
+
+
+def _entries(digest: str) -> list[tuple[int, Any]]:
+    prefix = f"{digest}."
+    found = []
+    try:
+        names = os.listdir(CACHE_DIR)
+    except FileNotFoundError:
+        return found
+    for name in names:
+        if not (name.startswith(prefix) and name.endswith(".json")):
+            continue
+        expires_part = name[len(prefix) : -len(".json")]
+        if expires_part.isdigit():
+            found.append((int(expires_part), CACHE_DIR / name))
+    return found
+
+
+def load_cached_spec(model: str, url: str) -> dict[str, Any] | None:
+    now = time.time_ns()
+    for expires_ns, path in _entries(_digest(model, url)):
+        if expires_ns <= now:
+            path.unlink(missing_ok=True)
+            continue
+        try:
+            return _loads(path.read_bytes())
+        except (json.JSONDecodeError, ValueError):
+            path.unlink(missing_ok=True)
+            return None
+    return None
+
+
+def save_spec_cache(model: str, url: str, spec: dict[str, Any]) -> None:
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    digest = _digest(model, url)
+    for _, path in _entries(digest):
+        path.unlink(missing_ok=True)
+    expires_ns = time.time_ns() + TTL_SECONDS * 1_000_000_000
+    path = CACHE_DIR / f"{digest}.{expires_ns}.json"
+    tmp = CACHE_DIR / f".{digest}.tmp"
+    tmp.write_bytes(_dumps(spec))
+    os.replace(tmp, path)
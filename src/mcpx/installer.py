@@ -1,15 +1,59 @@
+from __future__ import annotations
+
+import atexit
 import ipaddress
 import json
 import socket
-from typing import Any, Callable
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, fields
+from typing import TYPE_CHECKING, Any, Callable
 from urllib.parse import urlparse
 
-import httpx
-from bs4 import BeautifulSoup
-from pydantic import BaseModel, Field
+# httpx pulls in h2 and friends; deferring it keeps `import mcpx.installer`
+# cheap until a client is actually built.
+if TYPE_CHECKING:
+    import httpx
+
+try:
+    from selectolax.parser import HTMLParser as _SelectolaxParser
+except ImportError:  # pragma: no cover - selectolax is optional
+    _SelectolaxParser = None
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - orjson is optional
+    from json import loads as _json_loads
+
+try:
+    import ijson as _ijson
+except ImportError:  # pragma: no cover - ijson is optional
+    _ijson = None
 
+from mcpx import __version__
 from mcpx.agent import ToolDef, agent_loop
 
+_shared_client: httpx.Client | None = None
+
+
+def _get_shared_client() -> httpx.Client:
+    """Process-wide httpx client with keep-alive, so repeat requests to the
+    same registry hosts skip the TCP+TLS handshake."""
+    global _shared_client
+    if _shared_client is None:
+        import httpx
+
+        _shared_client = httpx.Client(
+            http2=True,
+            follow_redirects=True,
+            timeout=15,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=40, keepalive_expiry=60),
+            headers={"user-agent": f"mcpx/{__version__}"},
+        )
+        atexit.register(_shared_client.close)
+    return _shared_client
+
 SYSTEM_PROMPT = """\
 You are an expert at configuring MCP (Model Context Protocol) servers.
 You receive a URL and have tools to investigate it and install the server.
@@ -21,6 +65,7 @@ Strategy:
    - Python: https://raw.githubusercontent.com/<owner>/<repo>/HEAD/pyproject.toml
    Read the exact "name" field from the manifest.
 3. Search for that exact name on npm (search_npm) or PyPI (search_pypi).
+   Prefer probe_package: it checks npm, PyPI, and the repo manifests in one call.
    If not found, also try common variations (scoped name @owner/name, with -mcp suffix).
 4. Install based on what you found:
 
@@ -44,9 +89,71 @@ Rules:
 """
 
 MAX_TEXT_LENGTH = 8000
+# Raw download cap: generous headroom over MAX_TEXT_LENGTH since markup is
+# mostly stripped away before the text limit applies.
+MAX_FETCH_BYTES = 4 * MAX_TEXT_LENGTH
 ALLOWED_COMMANDS = {"npx", "uvx"}
 
 
+class ToolError(Exception):
+    """Transient tool failure (network blip, 5xx, DNS hiccup).
+
+    Raised rather than returned so agent_loop reports the message to the
+    model without persisting it in the tool cache; deterministic outcomes
+    (policy blocks, 404s) are returned as strings and may be cached.
+    """
+
+_STRIP_TAGS = ("script", "style", "nav", "footer", "header")
+
+
+def _html_to_text(html: str) -> str:
+    """Strip boilerplate tags and flatten HTML to text.
+
+    selectolax's C parser is roughly an order of magnitude faster than
+    html.parser on README-sized pages; BeautifulSoup remains the fallback.
+    """
+    if _SelectolaxParser is not None:
+        tree = _SelectolaxParser(html)
+        for node in tree.css(",".join(_STRIP_TAGS)):
+            node.decompose()
+        body = tree.body or tree.root
+        return body.text(separator="\n", strip=True) if body else ""
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, "html.parser")
+    for tag in soup(list(_STRIP_TAGS)):
+        tag.decompose()
+    return soup.get_text(separator="\n", strip=True)
+
+
+_DNS_TTL_SECONDS = 300
+_dns_cache: dict[str, tuple[float, list]] = {}
+
+
+def _resolve(host: str) -> list:
+    """getaddrinfo with a short TTL cache; agents re-fetch the same hosts
+    (github.com, raw.githubusercontent.com) many times per session.
+
+    All address families are kept: the SSRF check below must see IPv6
+    answers too.
+    """
+    now = time.monotonic()
+    hit = _dns_cache.get(host)
+    if hit is not None and now - hit[0] < _DNS_TTL_SECONDS:
+        return hit[1]
+    # TCP-only: without the hint getaddrinfo returns the same address once
+    # per socket type (stream/dgram/raw).
+    info = socket.getaddrinfo(host, None, type=socket.SOCK_STREAM, proto=socket.IPPROTO_TCP)
+    _dns_cache[host] = (now, info)
+    return info
+
+
+def _check_ip(ip: ipaddress.IPv4Address | ipaddress.IPv6Address, hostname: str) -> str | None:
+    if ip.is_private or ip.is_loopback or ip.is_link_local:
+        return f"Blocked: {hostname} resolves to private/loopback IP {ip}"
+    return None
+
+
 def _validate_url(url: str) -> str | None:
     parsed = urlparse(url)
     if parsed.scheme not in ("http", "https"):
@@ -55,131 +162,301 @@ def _validate_url(url: str) -> str | None:
     if not hostname:
         return "Missing hostname in URL."
     try:
-        addrinfos = socket.getaddrinfo(hostname, None)
-    except socket.gaierror:
-        return f"Cannot resolve hostname: {hostname}"
-    for _, _, _, _, sockaddr in addrinfos:
-        ip = ipaddress.ip_address(sockaddr[0])
-        if ip.is_private or ip.is_loopback or ip.is_link_local:
-            return f"Blocked: {hostname} resolves to private/loopback IP {ip}"
+        # Literal IPs need no resolver round trip — and checking the literal
+        # directly leaves no room for DNS tricks.
+        return _check_ip(ipaddress.ip_address(hostname), hostname)
+    except ValueError:
+        pass
+    try:
+        addrinfos = _resolve(hostname)
+    except socket.gaierror as e:
+        # Resolution failures are often transient; raise so they aren't cached.
+        raise ToolError(f"Cannot resolve hostname: {hostname}") from e
+    # Dedup before parsing: v4-mapped and repeated answers collapse to one
+    # ip_address construction each.
+    for addr in {sockaddr[0] for _, _, _, _, sockaddr in addrinfos}:
+        err = _check_ip(ipaddress.ip_address(addr), hostname)
+        if err:
+            return err
     return None
 
 
-class InstallSpec(BaseModel):
+@dataclass(slots=True)
+class InstallSpec:
     alias: str
     command: str
-    args: list[str] = Field(default_factory=list)
-    env_vars: list[str] = Field(default_factory=list)
+    args: list[str] = field(default_factory=list)
+    env_vars: list[str] = field(default_factory=list)
     notes: str = ""
 
 
 def _validate_install(args: dict) -> InstallSpec:
     if args.get("command") not in ALLOWED_COMMANDS:
         raise ValueError(f"Invalid command {args.get('command')!r}. Allowed: {ALLOWED_COMMANDS}")
-    return InstallSpec(**args)
+    if not isinstance(args.get("alias"), str) or not args["alias"]:
+        raise ValueError("Missing or invalid 'alias'.")
+    if not all(isinstance(a, str) for a in args.get("args", [])):
+        raise ValueError("'args' must be a list of strings.")
+    if not all(isinstance(v, str) for v in args.get("env_vars", [])):
+        raise ValueError("'env_vars' must be a list of strings.")
+    known = {f.name for f in fields(InstallSpec)}
+    return InstallSpec(**{k: v for k, v in args.items() if k in known})
+
+
+# Static JSON schemas, hoisted so _build_tools only rebuilds the executors
+# that close over the client.
+_FETCH_URL_SCHEMA = {
+    "type": "object",
+    "properties": {"url": {"type": "string", "description": "URL to fetch"}},
+    "required": ["url"],
+}
+_SEARCH_NPM_SCHEMA = {
+    "type": "object",
+    "properties": {"package_name": {"type": "string", "description": "npm package name"}},
+    "required": ["package_name"],
+}
+_SEARCH_PYPI_SCHEMA = {
+    "type": "object",
+    "properties": {"package_name": {"type": "string", "description": "PyPI package name"}},
+    "required": ["package_name"],
+}
+_PROBE_PACKAGE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "package_name": {"type": "string", "description": "Package name to look up"},
+        "repo": {"type": "string", "description": "Optional GitHub owner/repo whose manifests should be fetched"},
+    },
+    "required": ["package_name"],
+}
+_INSTALL_SERVER_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "alias": {"type": "string", "description": "Short lowercase alias for the server"},
+        "command": {"type": "string", "description": "Command to run: 'npx' or 'uvx'"},
+        "args": {"type": "array", "items": {"type": "string"}, "description": "Command arguments"},
+        "env_vars": {"type": "array", "items": {"type": "string"}, "description": "Required environment variable names"},
+        "notes": {"type": "string", "description": "Any notes for the user"},
+    },
+    "required": ["alias", "command", "args"],
+}
+
+# Tool calls fan out across threads (probe_package, parallel agent tool
+# calls); a per-host cap keeps a burst of probes from hammering one
+# registry and tripping its rate limits.
+_HOST_CONCURRENCY = 4
+_host_sems: dict[str, threading.Semaphore] = {}
+_host_sems_lock = threading.Lock()
+
+
+def _host_limit(url: str) -> threading.Semaphore:
+    host = urlparse(url).hostname or ""
+    with _host_sems_lock:
+        return _host_sems.setdefault(host, threading.Semaphore(_HOST_CONCURRENCY))
+
+
+# Conditional-request cache for registry metadata: url -> (etag, body).
+# Agents ask about the same package names repeatedly; a revalidation hit
+# costs one header-only round trip (HTTP 304) instead of a full body.
+_registry_cache: dict[str, tuple[str, bytes]] = {}
+
+
+def _registry_get(http: httpx.Client, url: str, accept: str | None = None) -> tuple[int, bytes]:
+    """GET a registry URL with ETag revalidation; returns (status, body)."""
+    headers = {"accept": accept} if accept else {}
+    cached = _registry_cache.get(url)
+    if cached is not None:
+        headers["if-none-match"] = cached[0]
+    with _host_limit(url):
+        resp = http.get(url, headers=headers or None)
+    if resp.status_code == 304 and cached is not None:
+        return 200, cached[1]
+    etag = resp.headers.get("etag")
+    if etag and resp.status_code == 200:
+        _registry_cache[url] = (etag, resp.content)
+    return resp.status_code, resp.content
+
+
+# Bodies above this size are walked with ijson instead of being parsed into
+# a full object tree; corgi/PyPI responses normally stay well under it.
+_STREAM_PARSE_THRESHOLD = 1 << 20
+
+
+def _parse_npm_packument(body: bytes) -> dict[str, Any]:
+    """Parse a packument, materializing only the fields search_npm reports.
+
+    Registries that ignore the corgi Accept header can return multi-MB
+    documents where almost all of the bulk is old versions; the streaming
+    path extracts name, description, dist-tags, and the latest version
+    without ever building the versions dict.
+    """
+    if _ijson is None or len(body) < _STREAM_PARSE_THRESHOLD:
+        return _json_loads(body)
+    dist_tags = dict(_ijson.kvitems(body, "dist-tags"))
+    latest = dist_tags.get("latest")
+    versions: dict[str, Any] = {}
+    if latest:
+        for version, entry in _ijson.kvitems(body, "versions"):
+            if version == latest:
+                versions[latest] = entry
+                break
+    return {
+        "name": next(_ijson.items(body, "name"), None),
+        "description": next(_ijson.items(body, "description"), None),
+        "dist-tags": dist_tags,
+        "versions": versions,
+    }
+
+
+def _parse_pypi_info(body: bytes) -> dict[str, Any]:
+    """Extract the "info" object; "releases"/"urls" carry most of the bytes."""
+    if _ijson is None or len(body) < _STREAM_PARSE_THRESHOLD:
+        return _json_loads(body).get("info", {})
+    return next(_ijson.items(body, "info"), {}) or {}
+
+
+_shared_tools: list[ToolDef] | None = None
 
 
 def _build_tools(http: httpx.Client) -> list[ToolDef]:
+    import httpx
+
     def exec_fetch_url(args: dict[str, Any]) -> str:
         url = args["url"]
         err = _validate_url(url)
         if err:
             return err
         try:
-            resp = http.get(url)
-            resp.raise_for_status()
-        except httpx.HTTPError as e:
+            # Stream and stop at the cap instead of downloading whole pages
+            # whose tail gets truncated anyway.
+            with _host_limit(url), http.stream("GET", url) as resp:
+                resp.raise_for_status()
+                buf = bytearray()
+                for chunk in resp.iter_bytes():
+                    buf += chunk
+                    if len(buf) >= MAX_FETCH_BYTES:
+                        break
+                encoding = resp.encoding or "utf-8"
+                ct = resp.headers.get("content-type", "")
+        except httpx.HTTPStatusError as e:
+            # 4xx is a deterministic answer about the URL (missing manifest,
+            # private repo) and may be cached; 5xx is the server's problem.
+            if e.response.status_code >= 500:
+                raise ToolError(f"Error fetching URL: {e}") from e
             return f"Error fetching URL: {e}"
-        ct = resp.headers.get("content-type", "")
-        if "html" in ct:
-            soup = BeautifulSoup(resp.text, "html.parser")
-            for tag in soup(["script", "style", "nav", "footer", "header"]):
-                tag.decompose()
-            text = soup.get_text(separator="\n", strip=True)
-        else:
-            text = resp.text
+        except httpx.HTTPError as e:
+            raise ToolError(f"Error fetching URL: {e}") from e
+        raw = bytes(buf[:MAX_FETCH_BYTES]).decode(encoding, errors="replace")
+        text = _html_to_text(raw) if "html" in ct else raw
         return text[:MAX_TEXT_LENGTH]
 
     def exec_search_npm(args: dict[str, Any]) -> str:
         package_name = args["package_name"]
         try:
-            resp = http.get(f"https://registry.npmjs.org/{package_name}")
-            if resp.status_code == 404:
+            # The abbreviated "corgi" packument is 10-100x smaller than the
+            # full document and still carries dist-tags, versions, and bin.
+            status, body = _registry_get(
+                http,
+                f"https://registry.npmjs.org/{package_name}",
+                accept="application/vnd.npm.install-v1+json",
+            )
+            if status == 404:
                 return f"Package '{package_name}' not found on npm."
-            resp.raise_for_status()
-            data = resp.json()
+            if status >= 400:
+                raise ToolError(f"Error searching npm: HTTP {status}")
+            data = _parse_npm_packument(body)
             latest = data.get("dist-tags", {}).get("latest", "unknown")
             version_data = data.get("versions", {}).get(latest, {})
             return json.dumps({
                 "name": data.get("name"),
                 "version": latest,
-                "description": data.get("description", ""),
+                "description": data.get("description") or version_data.get("description", ""),
                 "bin": version_data.get("bin", {}),
             })
+        except ToolError:
+            raise
         except Exception as e:
-            return f"Error searching npm: {e}"
+            raise ToolError(f"Error searching npm: {e}") from e
 
     def exec_search_pypi(args: dict[str, Any]) -> str:
         package_name = args["package_name"]
         try:
-            resp = http.get(f"https://pypi.org/pypi/{package_name}/json")
-            if resp.status_code == 404:
+            status, body = _registry_get(http, f"https://pypi.org/pypi/{package_name}/json")
+            if status == 404:
                 return f"Package '{package_name}' not found on PyPI."
-            resp.raise_for_status()
-            info = resp.json().get("info", {})
+            if status >= 400:
+                raise ToolError(f"Error searching PyPI: HTTP {status}")
+            info = _parse_pypi_info(body)
             return json.dumps({
                 "name": info.get("name"),
                 "version": info.get("version"),
                 "summary": info.get("summary", ""),
             })
+        except ToolError:
+            raise
         except Exception as e:
-            return f"Error searching PyPI: {e}"
+            raise ToolError(f"Error searching PyPI: {e}") from e
+
+    def exec_probe_package(args: dict[str, Any]) -> str:
+        package_name = args["package_name"]
+        repo = args.get("repo")
+        # Registry and manifest lookups are independent network calls;
+        # overlapping them takes one slow RTT instead of their sum.
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = {
+                "npm": pool.submit(exec_search_npm, {"package_name": package_name}),
+                "pypi": pool.submit(exec_search_pypi, {"package_name": package_name}),
+            }
+            if repo:
+                base = f"https://raw.githubusercontent.com/{repo}/HEAD"
+                futures["package_json"] = pool.submit(exec_fetch_url, {"url": f"{base}/package.json"})
+                futures["pyproject"] = pool.submit(exec_fetch_url, {"url": f"{base}/pyproject.toml"})
+            results = {}
+            transient = False
+            for key, f in futures.items():
+                try:
+                    results[key] = f.result()
+                except ToolError as e:
+                    results[key] = str(e)
+                    transient = True
+        payload = json.dumps(results)
+        if transient:
+            # Only a transport-level failure poisons the probe: 404s (a repo
+            # has either package.json or pyproject.toml, rarely both) come
+            # back as strings above and leave the result complete and
+            # cacheable. Partial results still reach the model via the
+            # error message, but must not be cached.
+            raise ToolError(payload)
+        return payload
 
     return [
         ToolDef(
             name="fetch_url",
             description="Fetch a web page and return its text content (HTML stripped to text). Use for GitHub pages, READMEs, package.json, etc.",
-            parameters={
-                "type": "object",
-                "properties": {"url": {"type": "string", "description": "URL to fetch"}},
-                "required": ["url"],
-            },
+            parameters=_FETCH_URL_SCHEMA,
             execute=exec_fetch_url,
         ),
         ToolDef(
             name="search_npm",
             description="Check if an npm package exists. Returns name, version, description, and bin entries.",
-            parameters={
-                "type": "object",
-                "properties": {"package_name": {"type": "string", "description": "npm package name"}},
-                "required": ["package_name"],
-            },
+            parameters=_SEARCH_NPM_SCHEMA,
             execute=exec_search_npm,
         ),
         ToolDef(
             name="search_pypi",
             description="Check if a Python package exists on PyPI. Returns name, version, and summary.",
-            parameters={
-                "type": "object",
-                "properties": {"package_name": {"type": "string", "description": "PyPI package name"}},
-                "required": ["package_name"],
-            },
+            parameters=_SEARCH_PYPI_SCHEMA,
             execute=exec_search_pypi,
         ),
+        ToolDef(
+            name="probe_package",
+            description="Check npm and PyPI for a package (and optionally the repo's package.json/pyproject.toml) in one concurrent call.",
+            parameters=_PROBE_PACKAGE_SCHEMA,
+            execute=exec_probe_package,
+        ),
         ToolDef(
             name="install_server",
             description="Install the MCP server. Only call this after verifying the package exists.",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "alias": {"type": "string", "description": "Short lowercase alias for the server"},
-                    "command": {"type": "string", "description": "Command to run: 'npx' or 'uvx'"},
-                    "args": {"type": "array", "items": {"type": "string"}, "description": "Command arguments"},
-                    "env_vars": {"type": "array", "items": {"type": "string"}, "description": "Required environment variable names"},
-                    "notes": {"type": "string", "description": "Any notes for the user"},
-                },
-                "required": ["alias", "command", "args"],
-            },
+            parameters=_INSTALL_SERVER_SCHEMA,
         ),
     ]
 
@@ -191,22 +468,24 @@ def run_agent(
     on_text: Callable[[str], None] | None = None,
     http_client: httpx.Client | None = None,
 ) -> InstallSpec | None:
-    http = http_client or httpx.Client(follow_redirects=True, timeout=15)
-    try:
-        tools = _build_tools(http)
-        result = agent_loop(
-            model=model,
-            system_prompt=SYSTEM_PROMPT,
-            user_message=f"Install MCP server from this URL: {url}",
-            tools=tools,
-            terminal_tool="install_server",
-            max_steps=10,
-            on_step=on_step,
-            on_text=on_text,
-        )
-    finally:
-        if http_client is None:
-            http.close()
+    global _shared_tools
+    if http_client is None:
+        # The shared client outlives the call, so its tool list is built once.
+        if _shared_tools is None:
+            _shared_tools = _build_tools(_get_shared_client())
+        tools = _shared_tools
+    else:
+        tools = _build_tools(http_client)
+    result = agent_loop(
+        model=model,
+        system_prompt=SYSTEM_PROMPT,
+        user_message=f"Install MCP server from this URL: {url}",
+        tools=tools,
+        terminal_tool="install_server",
+        max_steps=10,
+        on_step=on_step,
+        on_text=on_text,
+    )
     if result is None:
         return None
     return _validate_install(result)
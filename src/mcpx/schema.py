@@ -1,8 +1,8 @@
+import functools
 import json
 from typing import Any
 
 import click
-import jsonschema
 
 
 def _json_type(value: str) -> Any:
@@ -12,52 +12,88 @@ def _json_type(value: str) -> Any:
         raise click.BadParameter(f"Invalid JSON: {e}") from e
 
 
-_TYPE_MAP: dict[str, tuple[type | Any, Any]] = {
-    "string": (str, None),
-    "integer": (int, None),
-    "number": (float, None),
-    "boolean": (bool, None),
-    "object": (_json_type, None),
-    "array": (_json_type, None),
+def _make_flag(name: str, prop: dict[str, Any], required: bool, help_text: str) -> click.Option:
+    return click.Option(
+        [f"--{name}/--no-{name}"],
+        default=prop.get("default", False),
+        help=help_text,
+    )
+
+
+def _make_valued(click_type: Any) -> Any:
+    def make(name: str, prop: dict[str, Any], required: bool, help_text: str) -> click.Option:
+        default = prop.get("default")
+        return click.Option(
+            [f"--{name}"],
+            type=click_type,
+            required=required and "default" not in prop,
+            default=default,
+            help=help_text,
+        )
+
+    return make
+
+
+# schema type -> option factory, so the build loop is one dict lookup and
+# one call per property instead of a conditional chain.
+_MAKERS: dict[str, Any] = {
+    "string": _make_valued(str),
+    "integer": _make_valued(int),
+    "number": _make_valued(float),
+    "boolean": _make_flag,
+    "object": _make_valued(_json_type),
+    "array": _make_valued(_json_type),
 }
+_DEFAULT_MAKER = _MAKERS["string"]
 
 
 def build_click_params(input_schema: dict[str, Any]) -> list[click.Parameter]:
+    """Build Click params for a tool schema, memoized on the schema's JSON form."""
+    return list(_build_params_cached(json.dumps(input_schema, sort_keys=True)))
+
+
+@functools.lru_cache(maxsize=256)
+def _build_params_cached(schema_json: str) -> tuple[click.Parameter, ...]:
+    return tuple(_build_click_params(json.loads(schema_json)))
+
+
+def _build_click_params(input_schema: dict[str, Any]) -> list[click.Parameter]:
     properties = input_schema.get("properties", {})
     required = set(input_schema.get("required", []))
-    params: list[click.Parameter] = []
-    for name, prop in properties.items():
-        schema_type = prop.get("type", "string")
-        click_type, default = _TYPE_MAP.get(schema_type, (str, None))
-        is_required = name in required
-        help_text = prop.get("description", "")
-        if schema_type == "boolean":
-            params.append(
-                click.Option(
-                    [f"--{name}/--no-{name}"],
-                    default=prop.get("default", False),
-                    help=help_text,
-                )
-            )
-        else:
-            if "default" in prop:
-                default = prop["default"]
-                is_required = False
-            params.append(
-                click.Option(
-                    [f"--{name}"],
-                    type=click_type,
-                    required=is_required,
-                    default=default,
-                    help=help_text,
-                )
-            )
-    return params
+    return [
+        _MAKERS.get(prop.get("type", "string"), _DEFAULT_MAKER)(
+            name, prop, name in required, prop.get("description", "")
+        )
+        for name, prop in properties.items()
+    ]
+
+
+# schema type -> predicate. bool is excluded from integer/number because
+# it subclasses int; JSON Schema treats them as distinct types.
+_TYPE_CHECKS: dict[str, Any] = {
+    "string": lambda v: isinstance(v, str),
+    "integer": lambda v: isinstance(v, int) and not isinstance(v, bool),
+    "number": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    "boolean": lambda v: isinstance(v, bool),
+    "object": lambda v: isinstance(v, dict),
+    "array": lambda v: isinstance(v, list),
+}
 
 
 def validate_args(schema: dict[str, Any], args: dict[str, Any]) -> None:
+    """Check required keys and property types against the tool schema.
+
+    Click's option types already coerce values to the shapes declared by
+    build_click_params, so a single pass over the args covers everything
+    the schemas here actually use — no jsonschema machinery needed.
+    """
     cleaned = {k: v for k, v in args.items() if v is not None}
-    try:
-        jsonschema.validate(instance=cleaned, schema=schema)
-    except jsonschema.ValidationError as e:
-        raise click.ClickException(f"Validation error: {e.message}") from e
+    for key in schema.get("required", []):
+        if key not in cleaned:
+            raise click.ClickException(f"Validation error: {key!r} is a required property")
+    properties = schema.get("properties", {})
+    for key, value in cleaned.items():
+        expected = properties.get(key, {}).get("type")
+        check = _TYPE_CHECKS.get(expected)
+        if check is not None and not check(value):
+            raise click.ClickException(f"Validation error: {key!r} is not of type {expected!r}")
@@ -0,0 +1,71 @@
+"""Content-addressed cache for agent tool results.
+
+Real agent traces repeat a large share of tool calls (same URL fetched twice,
+same package probed on npm and again later), so identical (tool, arguments)
+pairs are served from a small sqlite store instead of re-executing the tool.
+"""
+
+import functools
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+
+from mcpx.config import CONFIG_DIR
+
+DB_FILE = CONFIG_DIR / "tool_cache.sqlite"
+TTL_SECONDS = 60 * 60  # 1 hour
+
+
+def cache_key(tool_name: str, args: dict) -> str:
+    payload = tool_name + "\x00" + json.dumps(args, sort_keys=True, separators=(",", ":"))
+    return hashlib.blake2b(payload.encode()).hexdigest()
+
+
+class ToolCache:
+    def __init__(self) -> None:
+        CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+        # Tool calls may be dispatched from worker threads, so the single
+        # connection is shared under a lock.
+        self._db = sqlite3.connect(DB_FILE, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS results "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._db.commit()
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT value, expires_at FROM results WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value, expires_at = row
+            if expires_at < time.time():
+                self._db.execute("DELETE FROM results WHERE key = ?", (key,))
+                self._db.commit()
+                return None
+            return value
+
+    def put(self, key: str, value: str, ttl: int = TTL_SECONDS) -> None:
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO results (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, value, time.time() + ttl),
+            )
+            self._db.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM results")
+            self._db.commit()
+
+
+@functools.lru_cache(maxsize=1)
+def get_tool_cache() -> ToolCache:
+    """Shared ToolCache instance, opened on first use."""
+    return ToolCache()